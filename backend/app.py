@@ -1,29 +1,74 @@
-from fastapi import FastAPI, HTTPException, Depends, Header
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, joinedload
-from contextlib import contextmanager
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import (
+    Boolean, Float, String, bindparam, case, delete, event, exists, func, insert,
+    lambda_stmt, select, text, update
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from pydantic import TypeAdapter
+from contextlib import asynccontextmanager
 from typing import Optional
+import asyncio
+import hashlib
 import os
-import uuid
+import time
 
 from models import Base, ProjectModel, TaskModel, UserModel
 from schemas import (
-    ProjectCreate, ProjectResponse, TaskCreate, TaskResponse,
+    ProjectCreate, ProjectResponse, ProjectSummaryResponse, TaskCreate, TaskResponse,
     UserCreate, UserLogin, UserResponse, TokenResponse
 )
 from auth import hash_password, verify_password, create_access_token, decode_token
 
 # Database setup
-DATABASE_URL = "sqlite:///./guilt_tracker.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DATABASE_URL = "sqlite+aiosqlite:///./guilt_tracker.db"
+# aiosqlite defaults to NullPool for file databases, which reopens the file
+# (and its -wal/-shm siblings) on every request; keep a few connections warm
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200,
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips indexes on tables that already exist
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_projects_user_id ON projects (user_id)"))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_project_id ON tasks (project_id)"))
+        # updated_at backs the project list ETag; older databases predate it
+        for table in ("projects", "tasks"):
+            columns = await conn.execute(text(f"PRAGMA table_info({table})"))
+            if "updated_at" not in {row[1] for row in columns}:
+                await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN updated_at DATETIME"))
+        # Emails are stored lowercased; OR IGNORE leaves rows that would collide
+        # untouched, and login falls back to an exact-case lookup for them
+        await conn.execute(text("UPDATE OR IGNORE users SET email = LOWER(email) WHERE email != LOWER(email)"))
+    yield
+    await engine.dispose()
 
-app = FastAPI(title="Guilt Tracker API")
+app = FastAPI(title="Guilt Tracker API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 def get_allowed_origins() -> list[str]:
     local_origins = [
@@ -44,15 +89,96 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@contextmanager
-def get_db_session():
-    db = SessionLocal()
-    try:
+# Prebuilt statements for the hot single-row lookups. lambda_stmt caches the
+# compiled SQL by the lambda's code location, so requests only bind params.
+_user_by_email_stmt = lambda_stmt(
+    lambda: select(UserModel).where(UserModel.email == bindparam("email"))
+)
+_owned_project_with_tasks_stmt = lambda_stmt(
+    lambda: select(ProjectModel).options(joinedload(ProjectModel.tasks)).where(
+        ProjectModel.id == bindparam("pid"),
+        ProjectModel.user_id == bindparam("uid")
+    )
+)
+# Cheap fingerprint of a user's projects and tasks for the list ETag. The
+# counts catch deletes, which leave no updated_at behind.
+_projects_etag_stmt = lambda_stmt(
+    lambda: select(
+        func.count(ProjectModel.id.distinct()),
+        func.max(ProjectModel.updated_at),
+        func.count(TaskModel.id),
+        func.max(TaskModel.updated_at)
+    ).select_from(ProjectModel).outerjoin(
+        TaskModel, TaskModel.project_id == ProjectModel.id
+    ).where(ProjectModel.user_id == bindparam("uid"))
+)
+
+# Mutations fold the ownership check into the statement itself, so each is a
+# single round trip instead of SELECT, mutate, then refresh
+_toggle_task_stmt = lambda_stmt(
+    lambda: update(TaskModel).where(
+        TaskModel.id == bindparam("tid"),
+        TaskModel.project_id.in_(
+            select(ProjectModel.id).where(ProjectModel.user_id == bindparam("uid"))
+        )
+    ).values(completed=~func.coalesce(TaskModel.completed, False)).returning(TaskModel.completed)
+)
+_delete_task_stmt = lambda_stmt(
+    lambda: delete(TaskModel).where(
+        TaskModel.id == bindparam("tid"),
+        TaskModel.project_id.in_(
+            select(ProjectModel.id).where(ProjectModel.user_id == bindparam("uid"))
+        )
+    ).returning(TaskModel.id)
+)
+_delete_project_stmt = lambda_stmt(
+    lambda: delete(ProjectModel).where(
+        ProjectModel.id == bindparam("pid"),
+        ProjectModel.user_id == bindparam("uid")
+    ).returning(ProjectModel.id)
+)
+# INSERT ... SELECT only inserts when the caller owns the project, so the
+# ownership check and the insert share one statement. It targets the Table so
+# the session runs it as plain Core rather than an ORM bulk insert.
+_create_task_stmt = insert(TaskModel.__table__).from_select(
+    ["id", "project_id", "title", "description", "completed", "weight"],
+    select(
+        bindparam("tid", type_=String),
+        bindparam("pid", type_=String),
+        bindparam("title", type_=String),
+        bindparam("description", type_=String),
+        bindparam("completed", type_=Boolean),
+        bindparam("weight", type_=Float)
+    ).where(
+        exists().where(
+            ProjectModel.id == bindparam("pid"),
+            ProjectModel.user_id == bindparam("uid")
+        )
+    )
+)
+# Bulk deletes bypass the ORM delete-orphan cascade, so tasks are removed explicitly
+_delete_project_tasks_stmt = lambda_stmt(
+    lambda: delete(TaskModel).where(TaskModel.project_id == bindparam("pid"))
+)
+
+# Validates a whole list of project summaries in one call into pydantic-core
+_project_summaries_adapter = TypeAdapter(list[ProjectSummaryResponse])
+
+def _new_id() -> str:
+    """Time-ordered hex ID (ms timestamp + 80 random bits) so inserts append to the PK index"""
+    return f"{time.time_ns() // 1_000_000:012x}{os.urandom(10).hex()}"
+
+@asynccontextmanager
+async def get_db_session():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
+# Decoded JWT payloads keyed by token hash; only successful validations are cached
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# /api/auth/me responses keyed by user_id; profile edits may be up to 30s stale
+_me_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     """Extract and validate JWT token from Authorization header"""
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
@@ -64,9 +190,17 @@ def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     except ValueError:
         raise HTTPException(status_code=401, detail="Invalid authorization header")
     
-    payload = decode_token(token)
-    if not payload:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    payload = _jwt_cache.get(key)
+    if payload is not None and payload.get("exp", 0) <= time.time():
+        # Never serve a token past its own expiry, even within the cache TTL
+        _jwt_cache.pop(key, None)
+        payload = None
+    if payload is None:
+        payload = decode_token(token)
+        if not payload:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        _jwt_cache[key] = payload
     
     user_id = payload.get("sub")
     if not user_id:
@@ -77,29 +211,29 @@ def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
 # ===== AUTH ENDPOINTS =====
 
 @app.post("/api/auth/signup", response_model=TokenResponse)
-def signup(user: UserCreate):
-    with get_db_session() as db:
+async def signup(user: UserCreate):
+    email = user.email.strip().lower()
+    async with get_db_session() as db:
         # Check if email already exists
-        existing = db.query(UserModel).filter(
-            UserModel.email == user.email
-        ).first()
+        result = await db.execute(_user_by_email_stmt, {"email": email})
+        existing = result.scalar_one_or_none()
         if existing:
             raise HTTPException(status_code=400, detail="Email already registered")
         
         # Create new user
-        user_id = str(uuid.uuid4())
+        user_id = _new_id()
         db_user = UserModel(
             id=user_id,
-            email=user.email,
+            email=email,
             name=user.name,
-            hashed_password=hash_password(user.password)
+            hashed_password=await asyncio.to_thread(hash_password, user.password)
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         # Create token
-        access_token = create_access_token(data={"sub": user_id, "email": user.email})
+        access_token = create_access_token(data={"sub": user_id, "email": email})
         
         return TokenResponse(
             access_token=access_token,
@@ -108,11 +242,25 @@ def signup(user: UserCreate):
         )
 
 @app.post("/api/auth/login", response_model=TokenResponse)
-def login(credentials: UserLogin):
-    with get_db_session() as db:
-        db_user = db.query(UserModel).filter(UserModel.email == credentials.email).first()
+async def login(credentials: UserLogin):
+    raw_email = credentials.email.strip()
+    email = raw_email.lower()
+    async with get_db_session() as db:
+        async def authenticate(lookup_email: str) -> Optional[UserModel]:
+            result = await db.execute(_user_by_email_stmt, {"email": lookup_email})
+            user = result.scalar_one_or_none()
+            if user and await asyncio.to_thread(
+                verify_password, credentials.password, user.hashed_password
+            ):
+                return user
+            return None
         
-        if not db_user or not verify_password(credentials.password, db_user.hashed_password):
+        db_user = await authenticate(email)
+        if not db_user and raw_email != email:
+            # Mixed-case rows the startup migration could not lowercase
+            # without colliding keep their original email
+            db_user = await authenticate(raw_email)
+        if not db_user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         access_token = create_access_token(data={"sub": db_user.id, "email": db_user.email})
@@ -124,120 +272,160 @@ def login(credentials: UserLogin):
         )
 
 @app.get("/api/auth/me", response_model=UserResponse)
-def get_current_user_info(current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        user = db.query(UserModel).filter(UserModel.id == current_user["user_id"]).first()
+async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+    cached = _me_cache.get(current_user["user_id"])
+    if cached is not None:
+        return cached
+    async with get_db_session() as db:
+        user = await db.get(UserModel, current_user["user_id"])
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        return UserResponse.model_validate(user)
+        response = UserResponse.model_validate(user)
+        _me_cache[current_user["user_id"]] = response
+        return response
 
 # ===== PROJECT ENDPOINTS =====
 
 @app.post("/api/projects", response_model=ProjectResponse)
-def create_project(project: ProjectCreate, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
+async def create_project(project: ProjectCreate, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
         db_project = ProjectModel(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             user_id=current_user["user_id"],
             name=project.name,
             description=project.description,
             reward=project.reward,
-            deadline=project.deadline,
-            created_at=datetime.utcnow()
+            deadline=project.deadline
         )
         db.add(db_project)
-        db.commit()
-        db.refresh(db_project)
-        _ = db_project.tasks
+        await db.commit()
+        # Lazy loads are not allowed under asyncio, so load tasks explicitly
+        await db.refresh(db_project, attribute_names=["tasks"])
         return ProjectResponse.model_validate(db_project)
 
-@app.get("/api/projects", response_model=list[ProjectResponse])
-def list_projects(current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        projects = db.query(ProjectModel).options(joinedload(ProjectModel.tasks)).filter(
-            ProjectModel.user_id == current_user["user_id"]
-        ).all()
-        result = [ProjectResponse.model_validate(p) for p in projects]
-        return result
+@app.get("/api/projects", response_model=list[ProjectSummaryResponse])
+async def list_projects(request: Request, current_user: dict = Depends(get_current_user)):
+    # The sidebar only needs per-project totals; tasks come from get_project
+    async with get_db_session() as db:
+        result = await db.execute(_projects_etag_stmt, {"uid": current_user["user_id"]})
+        fingerprint = ":".join(str(value) for value in result.one())
+        etag = '"' + hashlib.md5(f"{current_user['user_id']}:{fingerprint}".encode()).hexdigest() + '"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
+
+        result = await db.execute(
+            select(
+                ProjectModel.id,
+                ProjectModel.name,
+                ProjectModel.description,
+                ProjectModel.reward,
+                ProjectModel.deadline,
+                ProjectModel.created_at,
+                func.count(TaskModel.id).label("task_count"),
+                func.coalesce(
+                    func.sum(case((TaskModel.completed, 1), else_=0)), 0
+                ).label("completed_count"),
+                func.coalesce(func.sum(TaskModel.weight), 0).label("total_weight"),
+                func.coalesce(
+                    func.sum(case((TaskModel.completed, TaskModel.weight), else_=0)), 0
+                ).label("completed_weight"),
+            )
+            .outerjoin(TaskModel, TaskModel.project_id == ProjectModel.id)
+            .where(ProjectModel.user_id == current_user["user_id"])
+            .group_by(ProjectModel.id)
+            .order_by(ProjectModel.created_at, ProjectModel.id)
+        )
+        summaries = _project_summaries_adapter.validate_python(result.all(), from_attributes=True)
+        # Returning a Response skips FastAPI's response_model re-validation;
+        # response_model is kept for the OpenAPI schema
+        return Response(
+            _project_summaries_adapter.dump_json(summaries),
+            media_type="application/json",
+            headers=cache_headers
+        )
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: str, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        project = db.query(ProjectModel).options(joinedload(ProjectModel.tasks)).filter(
-            ProjectModel.id == project_id,
-            ProjectModel.user_id == current_user["user_id"]
-        ).first()
+async def get_project(project_id: str, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
+        result = await db.execute(
+            _owned_project_with_tasks_stmt,
+            {"pid": project_id, "uid": current_user["user_id"]}
+        )
+        project = result.unique().scalar_one_or_none()
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        return ProjectResponse.model_validate(project)
+        return Response(
+            ProjectResponse.model_validate(project).model_dump_json(), media_type="application/json"
+        )
 
 @app.delete("/api/projects/{project_id}")
-def delete_project(project_id: str, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        project = db.query(ProjectModel).filter(
-            ProjectModel.id == project_id,
-            ProjectModel.user_id == current_user["user_id"]
-        ).first()
-        if not project:
+async def delete_project(project_id: str, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
+        result = await db.execute(
+            _delete_project_stmt, {"pid": project_id, "uid": current_user["user_id"]}
+        )
+        if result.scalar_one_or_none() is None:
             raise HTTPException(status_code=404, detail="Project not found")
-        db.delete(project)
-        db.commit()
+        await db.execute(_delete_project_tasks_stmt, {"pid": project_id})
+        await db.commit()
         return {"message": "Project deleted"}
 
 # ===== TASK ENDPOINTS =====
 
 @app.post("/api/projects/{project_id}/tasks", response_model=TaskResponse)
-def create_task(project_id: str, task: TaskCreate, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        project = db.query(ProjectModel).filter(
-            ProjectModel.id == project_id,
-            ProjectModel.user_id == current_user["user_id"]
-        ).first()
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        db_task = TaskModel(
-            id=str(uuid.uuid4()),
+async def create_task(project_id: str, task: TaskCreate, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
+        new_task = TaskResponse(
+            id=_new_id(),
             project_id=project_id,
             title=task.title,
             description=task.description,
             completed=False,
             weight=task.weight or 1
         )
-        db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
-        return TaskResponse.model_validate(db_task)
+        result = await db.execute(
+            _create_task_stmt,
+            {
+                "tid": new_task.id,
+                "pid": project_id,
+                "uid": current_user["user_id"],
+                "title": new_task.title,
+                "description": new_task.description,
+                "completed": new_task.completed,
+                "weight": new_task.weight,
+            }
+        )
+        if result.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Project not found")
+        await db.commit()
+        return new_task
 
 @app.patch("/api/tasks/{task_id}/toggle")
-def toggle_task(task_id: str, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        task = db.query(TaskModel).join(ProjectModel).filter(
-            TaskModel.id == task_id,
-            ProjectModel.user_id == current_user["user_id"]
-        ).first()
-        if not task:
+async def toggle_task(task_id: str, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
+        result = await db.execute(
+            _toggle_task_stmt, {"tid": task_id, "uid": current_user["user_id"]}
+        )
+        completed = result.scalar_one_or_none()
+        if completed is None:
             raise HTTPException(status_code=404, detail="Task not found")
-        task.completed = not task.completed
-        db.commit()
-        db.refresh(task)
-        return TaskResponse.model_validate(task)
+        await db.commit()
+        return {"id": task_id, "completed": completed}
 
 @app.delete("/api/tasks/{task_id}")
-def delete_task(task_id: str, current_user: dict = Depends(get_current_user)):
-    with get_db_session() as db:
-        task = db.query(TaskModel).join(ProjectModel).filter(
-            TaskModel.id == task_id,
-            ProjectModel.user_id == current_user["user_id"]
-        ).first()
-        if not task:
+async def delete_task(task_id: str, current_user: dict = Depends(get_current_user)):
+    async with get_db_session() as db:
+        result = await db.execute(
+            _delete_task_stmt, {"tid": task_id, "uid": current_user["user_id"]}
+        )
+        if result.scalar_one_or_none() is None:
             raise HTTPException(status_code=404, detail="Task not found")
-        db.delete(task)
-        db.commit()
+        await db.commit()
         return {"message": "Task deleted"}
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 if __name__ == "__main__":
@@ -1,18 +1,21 @@
-from sqlalchemy import Column, String, Boolean, Float, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, Float, DateTime, ForeignKey, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from datetime import datetime, timezone
 
 Base = declarative_base()
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class UserModel(Base):
     __tablename__ = "users"
     
     id = Column(String, primary_key=True)
-    email = Column(String, unique=True, nullable=False)
+    email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
     name = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
     
     projects = relationship("ProjectModel", back_populates="owner", cascade="all, delete-orphan")
 
@@ -20,12 +23,13 @@ class ProjectModel(Base):
     __tablename__ = "projects"
     
     id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     reward = Column(String, nullable=True)
     deadline = Column(String, nullable=True)  # ISO date string
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     
     owner = relationship("UserModel", back_populates="projects")
     tasks = relationship("TaskModel", back_populates="project", cascade="all, delete-orphan")
@@ -34,10 +38,11 @@ class TaskModel(Base):
     __tablename__ = "tasks"
     
     id = Column(String, primary_key=True)
-    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(String, ForeignKey("projects.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
     completed = Column(Boolean, default=False)
     weight = Column(Float, default=1.0)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     
     project = relationship("ProjectModel", back_populates="tasks")
@@ -61,3 +61,18 @@ class ProjectResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+class ProjectSummaryResponse(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    reward: Optional[str] = None
+    deadline: Optional[str] = None
+    created_at: datetime
+    task_count: int
+    completed_count: int
+    total_weight: float
+    completed_weight: float
+    
+    class Config:
+        from_attributes = True
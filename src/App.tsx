@@ -1,6 +1,6 @@
 import { useState, useMemo, useEffect, useCallback } from 'react'
-import { Project } from './types'
-import { calculateProgress } from './lib/progress'
+import { Project, ProjectSummary } from './types'
+import { calculateProgress, summarizeProject } from './lib/progress'
 import {
   getMotivationalMessage,
   getGuiltMeterColor,
@@ -21,8 +21,10 @@ const apiUrl = (path: string) => `${apiBase}${path}`
 
 export function App() {
   const { isAuthenticated, user, token, logout, isLoading: authLoading } = useAuth()
-  const [projects, setProjects] = useState<Project[]>([])
+  const [projects, setProjects] = useState<ProjectSummary[]>([])
   const [currentProjectId, setCurrentProjectId] = useState<string | null>(null)
+  const [currentProject, setCurrentProject] = useState<Project | null>(null)
+  const [failedProjectId, setFailedProjectId] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
 
@@ -67,14 +69,54 @@ export function App() {
     }
   }, [isAuthenticated, user, token, loadProjects])
 
-  const currentProject = useMemo(
-    () => projects.find((p) => p.id === currentProjectId),
-    [projects, currentProjectId]
-  )
+  // The project list only carries summaries, so load tasks for the selected project
+  useEffect(() => {
+    if (!currentProjectId) {
+      setCurrentProject(null)
+      return
+    }
+    if (currentProject?.id === currentProjectId) return
+    if (failedProjectId === currentProjectId) return
+
+    let cancelled = false
+    const loadProject = async () => {
+      try {
+        const response = await fetch(apiUrl(`/api/projects/${currentProjectId}`), {
+          headers: getAuthHeaders(),
+        })
+        if (!response.ok) throw new Error('Failed to load project')
+        const data = await response.json()
+        if (!cancelled) setCurrentProject(data)
+      } catch (err) {
+        if (!cancelled) {
+          setCurrentProject(null)
+          setFailedProjectId(currentProjectId)
+          setError(err instanceof Error ? err.message : 'Failed to load project')
+        }
+      }
+    }
+    loadProject()
+    return () => {
+      cancelled = true
+    }
+  }, [currentProjectId, currentProject, failedProjectId, getAuthHeaders])
+
+  // Only render the loaded project once it matches the selection, so a stale
+  // project is never shown (or edited) while the next one is loading
+  const shownProject =
+    currentProject?.id === currentProjectId ? currentProject : null
+
+  // Apply a local change to the open project and keep its sidebar entry in sync
+  const updateCurrentProject = (updated: Project) => {
+    setCurrentProject(updated)
+    setProjects((prev) =>
+      prev.map((p) => (p.id === updated.id ? summarizeProject(updated) : p))
+    )
+  }
 
   const progressState = useMemo(
-    () => (currentProject ? calculateProgress(currentProject.tasks) : null),
-    [currentProject]
+    () => (shownProject ? calculateProgress(shownProject.tasks) : null),
+    [shownProject]
   )
 
   const motivationalMessage = useMemo(
@@ -108,7 +150,8 @@ export function App() {
       })
       if (!response.ok) throw new Error('Failed to create project')
       const newProject = await response.json()
-      setProjects([...projects, newProject])
+      setProjects([...projects, summarizeProject(newProject)])
+      setCurrentProject(newProject)
       setCurrentProjectId(newProject.id)
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to create project')
@@ -116,6 +159,8 @@ export function App() {
   }
 
   const handleSelectProject = (projectId: string) => {
+    // Clearing a failed load lets selecting the project again retry it
+    setFailedProjectId(null)
     setCurrentProjectId(projectId)
   }
 
@@ -142,30 +187,27 @@ export function App() {
     weight: number,
     description?: string
   ) => {
-    if (!currentProject) return
+    if (!shownProject) return
 
     try {
-      const response = await fetch(apiUrl(`/api/projects/${currentProject.id}/tasks`), {
+      const response = await fetch(apiUrl(`/api/projects/${shownProject.id}/tasks`), {
         method: 'POST',
         headers: getAuthHeaders(),
         body: JSON.stringify({ title, description, weight }),
       })
       if (!response.ok) throw new Error('Failed to create task')
       const newTask = await response.json()
-      setProjects(
-        projects.map((p) =>
-          p.id === currentProject.id
-            ? { ...p, tasks: [...p.tasks, newTask] }
-            : p
-        )
-      )
+      updateCurrentProject({
+        ...shownProject,
+        tasks: [...shownProject.tasks, newTask],
+      })
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to create task')
     }
   }
 
   const handleToggleTask = async (taskId: string) => {
-    if (!currentProject) return
+    if (!shownProject) return
 
     try {
       const response = await fetch(apiUrl(`/api/tasks/${taskId}/toggle`), {
@@ -173,26 +215,20 @@ export function App() {
         headers: getAuthHeaders(),
       })
       if (!response.ok) throw new Error('Failed to toggle task')
-      const updatedTask = await response.json()
-      setProjects(
-        projects.map((p) =>
-          p.id === currentProject.id
-            ? {
-                ...p,
-                tasks: p.tasks.map((t) =>
-                  t.id === taskId ? updatedTask : t
-                ),
-              }
-            : p
-        )
-      )
+      const { completed } = await response.json()
+      updateCurrentProject({
+        ...shownProject,
+        tasks: shownProject.tasks.map((t) =>
+          t.id === taskId ? { ...t, completed } : t
+        ),
+      })
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to toggle task')
     }
   }
 
   const handleRemoveTask = async (taskId: string) => {
-    if (!currentProject) return
+    if (!shownProject) return
 
     try {
       const response = await fetch(apiUrl(`/api/tasks/${taskId}`), {
@@ -200,16 +236,10 @@ export function App() {
         headers: getAuthHeaders(),
       })
       if (!response.ok) throw new Error('Failed to delete task')
-      setProjects(
-        projects.map((p) =>
-          p.id === currentProject.id
-            ? {
-                ...p,
-                tasks: p.tasks.filter((t) => t.id !== taskId),
-              }
-            : p
-        )
-      )
+      updateCurrentProject({
+        ...shownProject,
+        tasks: shownProject.tasks.filter((t) => t.id !== taskId),
+      })
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to delete task')
     }
@@ -259,14 +289,14 @@ return (
         </aside>
 
         <main className="app-main">
-          {loading ? (
+          {loading || (currentProjectId && !shownProject && failedProjectId !== currentProjectId) ? (
             <div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '100%' }}>
               <p>Loading projects...</p>
             </div>
-          ) : currentProject ? (
+          ) : shownProject ? (
             <div className="project-view">
               <ProjectHeader
-                project={currentProject}
+                project={shownProject}
                 onDeleteProject={handleDeleteProject}
               />
 
@@ -293,10 +323,10 @@ return (
                           {progressState.progressPercentage}%
                         </span>
                       </div>
-                      {currentProject.reward && (
+                      {shownProject.reward && (
                         <div className="stat">
                           <span className="stat-label">Reward</span>
-                          <span className="stat-value">{currentProject.reward}</span>
+                          <span className="stat-value">{shownProject.reward}</span>
                         </div>
                       )}
                     </div>
@@ -306,7 +336,7 @@ return (
                     <h2>Tasks</h2>
                     <TaskForm onAddTask={handleAddTask} />
                     <TaskList
-                      tasks={currentProject.tasks}
+                      tasks={shownProject.tasks}
                       onToggleTask={handleToggleTask}
                       onRemoveTask={handleRemoveTask}
                     />
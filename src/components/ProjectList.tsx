@@ -1,9 +1,9 @@
 import './ProjectList.css'
-import { Project } from '../types'
-import { calculateProgress } from '../lib/progress'
+import { ProjectSummary } from '../types'
+import { calculateSummaryProgress } from '../lib/progress'
 
 interface ProjectListProps {
-  projects: Project[]
+  projects: ProjectSummary[]
   currentProjectId: string | null
   onSelectProject: (projectId: string) => void
 }
@@ -27,8 +27,8 @@ export function ProjectList({
   return (
     <div className="project-list">
       {projects.map((project) => {
-        const progress = calculateProgress(project.tasks)
-        const isComplete = progress.progressPercentage === 100 && project.tasks.length > 0
+        const progressPercentage = calculateSummaryProgress(project)
+        const isComplete = progressPercentage === 100 && project.task_count > 0
         
         return (
           <button
@@ -53,7 +53,7 @@ export function ProjectList({
               {project.name}
             </div>
             <div className="project-list-tasks">
-              {project.tasks.length} tasks · {progress.progressPercentage}%
+              {project.task_count} tasks · {progressPercentage}%
             </div>
           </button>
         )
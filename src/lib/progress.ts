@@ -3,7 +3,7 @@
  * Separated from UI for testability and reusability
  */
 
-import { Task, ProgressState } from '../types'
+import { Task, Project, ProjectSummary, ProgressState } from '../types'
 
 /**
  * Calculate progress based on task completion and weights
@@ -31,3 +31,31 @@ export function calculateProgress(tasks: Task[]): ProgressState {
     guiltPercentage,
   }
 }
+
+/**
+ * Weighted completion percentage for a project summary
+ * Matches calculateProgress for the same set of tasks
+ */
+export function calculateSummaryProgress(summary: ProjectSummary): number {
+  const totalWeight = summary.total_weight || 1
+  return Math.round((summary.completed_weight / totalWeight) * 100)
+}
+
+/**
+ * Build the sidebar summary for a fully loaded project
+ * Used to keep the sidebar in sync after local task changes
+ */
+export function summarizeProject(project: Project): ProjectSummary {
+  const progress = calculateProgress(project.tasks)
+  return {
+    id: project.id,
+    name: project.name,
+    description: project.description,
+    reward: project.reward,
+    deadline: project.deadline,
+    task_count: progress.totalTasks,
+    completed_count: progress.completedTasks,
+    total_weight: project.tasks.reduce((sum, task) => sum + task.weight, 0),
+    completed_weight: progress.completedWeight,
+  }
+}
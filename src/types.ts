@@ -20,6 +20,21 @@ export interface Project {
   createdAt: string // ISO date string
 }
 
+/**
+ * Sidebar view of a project as returned by GET /api/projects (no tasks)
+ */
+export interface ProjectSummary {
+  id: string
+  name: string
+  description?: string
+  reward?: string
+  deadline?: string // ISO date string
+  task_count: number
+  completed_count: number
+  total_weight: number
+  completed_weight: number
+}
+
 export interface MotivationalMessage {
   minGuilt: number // percentage
   maxGuilt: number // percentage